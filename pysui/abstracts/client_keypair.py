@@ -27,11 +27,10 @@ class SignatureScheme(IntEnum):
 
     def as_str(self) -> str:
         """Get scheme as string."""
-        if self is SignatureScheme.ED25519:
-            return self.name
-        if self is SignatureScheme.SECP256K1:
-            return "Secp256k1"
-        raise TypeError(f"Unknown scheme {self.name}")
+        try:
+            return _AS_STR[self]
+        except KeyError as kerr:
+            raise TypeError(f"Unknown scheme {self.name}") from kerr
 
     @property
     def sig_scheme(self) -> str:
@@ -39,9 +38,17 @@ class SignatureScheme(IntEnum):
         return self.as_str()
 
 
+_AS_STR: dict[SignatureScheme, str] = {
+    SignatureScheme.ED25519: SignatureScheme.ED25519.name,
+    SignatureScheme.SECP256K1: "Secp256k1",
+}
+
+
 class Key(ABC):
     """Base key abstract class."""
 
+    __slots__ = ("_keybytes", "_scheme")
+
     def __init__(self, scheme: SignatureScheme, key_bytes: bytes) -> None:
         """Init with byte array."""
         self._keybytes = key_bytes
@@ -69,6 +76,8 @@ class Key(ABC):
 class PrivateKey(Key):
     """PrivateKey construct."""
 
+    __slots__ = ()
+
     @abstractmethod
     def sign(self, data: bytes) -> str:
         """Sign data and return signature."""
@@ -77,10 +86,14 @@ class PrivateKey(Key):
 class PublicKey(Key):
     """PublicKey construct."""
 
+    __slots__ = ()
+
 
 class KeyPair(ABC):
     """KeyPair construct."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def scheme(self) -> SignatureScheme:
@@ -15,13 +15,14 @@
 """Sui Crpto Utilities."""
 
 import base64
+import os
 
 from typing import Union
-import secp256k1
 import bip_utils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
 from bip_utils.bip.bip39.bip39_mnemonic_decoder import Bip39MnemonicDecoder
 from bip_utils.utils.mnemonic.mnemonic_validator import MnemonicValidator
+from coincurve import PrivateKey as Secp256k1PrivateKey, PublicKey as Secp256k1PublicKey
 from nacl.signing import SigningKey, VerifyKey
 from nacl.encoding import Base64Encoder
 
@@ -41,6 +42,11 @@ from pysui.sui.sui_constants import (
 )
 from pysui.sui.sui_types import SuiSignature, SuiAddress
 
+# Leading scheme byte of serialized keypairs
+_SCHEME_TAG: dict[SignatureScheme, bytes] = {
+    SignatureScheme.ED25519: b"\x00",
+    SignatureScheme.SECP256K1: b"\x01",
+}
 
 # Edwards Curve Keys
 
@@ -48,12 +54,14 @@ from pysui.sui.sui_types import SuiSignature, SuiAddress
 class SuiPublicKeyED25519(PublicKey):
     """A ED25519 Public Key."""
 
+    __slots__ = ("_verify_key",)
+
     def __init__(self, indata: bytes) -> None:
         """Initialize public key."""
         if len(indata) != ED25519_PUBLICKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Public Key expects {ED25519_PUBLICKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.ED25519, indata)
-        self._verify_key = VerifyKey(self.to_b64(), encoder=Base64Encoder)
+        self._verify_key = VerifyKey(indata)
 
     @property
     def pub_key(self) -> str:
@@ -64,13 +72,15 @@ class SuiPublicKeyED25519(PublicKey):
 class SuiPrivateKeyED25519(PrivateKey):
     """A ED25519 Private Key."""
 
+    __slots__ = ("_signing_key",)
+
     def __init__(self, indata: bytes) -> None:
         """Initialize private key."""
         dlen = len(indata)
         if dlen != ED25519_PRIVATEKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Private Key expects {ED25519_PRIVATEKEY_BYTES_LEN} bytes, found {dlen}")
         super().__init__(SignatureScheme.ED25519, indata)
-        self._signing_key = SigningKey(self.to_b64(), encoder=Base64Encoder)
+        self._signing_key = SigningKey(indata)
 
     def sign(self, data: bytes) -> SuiSignature:
         """ED25519 sign data bytes."""
@@ -80,6 +90,8 @@ class SuiPrivateKeyED25519(PrivateKey):
 class SuiKeyPairED25519(KeyPair):
     """A SuiKey Pair."""
 
+    __slots__ = ("_scheme", "_private_key", "_public_key")
+
     def __init__(self, pub_key_bytes: bytes, priv_key_bytes: bytes) -> None:
         """Init keypair with public and private byte array."""
         self._scheme = SignatureScheme.ED25519
@@ -103,8 +115,7 @@ class SuiKeyPairED25519(KeyPair):
 
     def to_bytes(self) -> bytes:
         """Convert keypair to bytes."""
-        all_bytes = self.scheme.to_bytes(1, "little") + self.public_key.key_bytes + self.private_key.key_bytes
-        return all_bytes
+        return b"".join((_SCHEME_TAG[self._scheme], self._public_key.key_bytes, self._private_key.key_bytes))
 
     @classmethod
     def unique(cls) -> "SuiKeyPairED25519":
@@ -121,15 +132,15 @@ class SuiKeyPairED25519(KeyPair):
             raise SuiInvalidKeyPair(f"Expect str len of {SUI_KEYPAIR_LEN}")
         base_decode = base64.b64decode(indata)
         if base_decode[0] == SignatureScheme.ED25519:
-            return SuiKeyPairED25519.from_bytes(base_decode[1:])
+            return SuiKeyPairED25519.from_bytes(memoryview(base_decode)[1:])
         raise SuiInvalidKeyPair("Scheme not ED25519")
 
     @classmethod
-    def from_bytes(cls, indata: bytes) -> KeyPair:
+    def from_bytes(cls, indata: Union[bytes, memoryview]) -> KeyPair:
         """Convert bytes to keypair."""
         if len(indata) != ED25519_KEYPAIR_BYTES_LEN:
             raise SuiInvalidKeyPair("Expect bytes len of 64")
-        return SuiKeyPairED25519(indata[0:32], indata[32:])
+        return SuiKeyPairED25519(bytes(indata[0:32]), bytes(indata[32:]))
 
     def __repr__(self) -> str:
         """To string."""
@@ -142,12 +153,27 @@ class SuiKeyPairED25519(KeyPair):
 class SuiPublicKeySECP256K1(PublicKey):
     """A SECP256K1 Public Key."""
 
+    __slots__ = ("_verify_key",)
+
     def __init__(self, indata: bytes) -> None:
         """Initialize public key."""
         if len(indata) != SECP256K1_PUBLICKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Public Key expects {SECP256K1_PUBLICKEY_BYTES_LEN} bytes, found {len(indata)}")
+        if indata[0] not in (2, 3):
+            raise SuiInvalidKeyPair(f"Public Key expects compressed prefix 0x02 or 0x03, found {indata[0]:#04x}")
         super().__init__(SignatureScheme.SECP256K1, indata)
-        self._verify_key = secp256k1.PublicKey(indata, raw=True)
+        try:
+            self._verify_key = Secp256k1PublicKey(indata)
+        except ValueError as verr:
+            raise SuiInvalidKeyPair(f"Public Key is not a valid secp256k1 point: {verr}") from verr
+
+    @classmethod
+    def _from_parsed(cls, verify_key: Secp256k1PublicKey) -> "SuiPublicKeySECP256K1":
+        """Initialize public key from an already parsed verify key, serializing it compressed."""
+        pub_key = cls.__new__(cls)
+        super(SuiPublicKeySECP256K1, pub_key).__init__(SignatureScheme.SECP256K1, verify_key.format(compressed=True))
+        pub_key._verify_key = verify_key
+        return pub_key
 
     @property
     def pub_key(self) -> str:
@@ -158,19 +184,30 @@ class SuiPublicKeySECP256K1(PublicKey):
 class SuiPrivateKeySECP256K1(PrivateKey):
     """A SECP256K1 Private Key."""
 
+    __slots__ = ("_signing_key",)
+
     def __init__(self, indata: bytes) -> None:
         """Initialize private key."""
         if len(indata) != SECP256K1_PRIVATEKEY_BYTES_LEN:
             raise SuiInvalidKeyPair(f"Private Key expects {SECP256K1_PRIVATEKEY_BYTES_LEN} bytes, found {len(indata)}")
         super().__init__(SignatureScheme.SECP256K1, indata)
-        self._signing_key = secp256k1.PrivateKey(indata, raw=True)
+        try:
+            self._signing_key = Secp256k1PrivateKey(indata)
+        except ValueError as verr:
+            raise SuiInvalidKeyPair(f"Private Key is not a valid secp256k1 secret: {verr}") from verr
+
+    @classmethod
+    def _from_parsed(cls, signing_key: Secp256k1PrivateKey) -> "SuiPrivateKeySECP256K1":
+        """Initialize private key from an already parsed signing key."""
+        prv_key = cls.__new__(cls)
+        super(SuiPrivateKeySECP256K1, prv_key).__init__(SignatureScheme.SECP256K1, signing_key.secret)
+        prv_key._signing_key = signing_key
+        return prv_key
 
     def sign(self, data: bytes) -> str:
         """secp256k1 sign data bytes."""
-        sig = self._signing_key.ecdsa_sign_recoverable(data)
-        sig_sb, sig_si = self._signing_key.ecdsa_recoverable_serialize(sig)
-        sig_ba = bytearray(sig_sb)
-        sig_ba.append(sig_si)
+        # Compact signature (64 bytes) followed by recovery id (1 byte)
+        sig_ba = self._signing_key.sign_recoverable(data)
         fsig = base64.b64encode(sig_ba).decode()
         return SuiSignature(fsig)
 
@@ -178,12 +215,27 @@ class SuiPrivateKeySECP256K1(PrivateKey):
 class SuiKeyPairSECP256K1(KeyPair):
     """A SuiKey Pair."""
 
+    __slots__ = ("_scheme", "_private_key", "_public_key")
+
     def __init__(self, pub_key_bytes: bytes, priv_key_bytes: bytes) -> None:
         """Init keypair with public and private byte array."""
         self._scheme = SignatureScheme.SECP256K1
         self._public_key = SuiPublicKeySECP256K1(pub_key_bytes)
         self._private_key = SuiPrivateKeySECP256K1(priv_key_bytes)
 
+    @classmethod
+    def _from_signer(cls, signer: Secp256k1PrivateKey) -> "SuiKeyPairSECP256K1":
+        """Initialize keypair from a parsed signer, reusing it and its public key without re-parsing.
+
+        Both keys are taken from the signer itself so they always match.
+        """
+        keypair = cls.__new__(cls)
+        keypair._scheme = SignatureScheme.SECP256K1
+        # pylint: disable=protected-access
+        keypair._public_key = SuiPublicKeySECP256K1._from_parsed(signer.public_key)
+        keypair._private_key = SuiPrivateKeySECP256K1._from_parsed(signer)
+        return keypair
+
     @property
     def private_key(self) -> PrivateKey:
         """Return the Private Key."""
@@ -201,14 +253,12 @@ class SuiKeyPairSECP256K1(KeyPair):
 
     def to_bytes(self) -> bytes:
         """Convert keypair to bytes."""
-        all_bytes = self.scheme.to_bytes(1, "little") + self.public_key.key_bytes + self.private_key.key_bytes
-        return all_bytes
+        return b"".join((_SCHEME_TAG[self._scheme], self._public_key.key_bytes, self._private_key.key_bytes))
 
     @classmethod
     def unique(cls) -> KeyPair:
         """Generate a unique secp256k1 keypair."""
-        signer = secp256k1.PrivateKey()
-        return cls(signer.pubkey.serialize(compressed=True), signer.private_key)
+        return cls._from_signer(Secp256k1PrivateKey())
 
     @classmethod
     def from_b64(cls, indata: str) -> KeyPair:
@@ -217,21 +267,28 @@ class SuiKeyPairSECP256K1(KeyPair):
             raise SuiInvalidKeyPair(f"Expect str len of {SUI_KEYPAIR_LEN}")
         base_decode = base64.b64decode(indata)
         if base_decode[0] == SignatureScheme.SECP256K1:
-            return SuiKeyPairSECP256K1.from_bytes(base_decode[1:])
+            return SuiKeyPairSECP256K1.from_bytes(memoryview(base_decode)[1:])
         raise SuiInvalidKeyPair("Scheme not SECP256K1")
 
     @classmethod
-    def from_bytes(cls, indata: bytes) -> KeyPair:
+    def from_bytes(cls, indata: Union[bytes, memoryview]) -> KeyPair:
         """Convert bytes to keypair."""
         if len(indata) != SECP256K1_KEYPAIR_BYTES_LEN:
             raise SuiInvalidKeyPair("Expect bytes len of 65")
-        return SuiKeyPairSECP256K1(indata[0:33], indata[33:])
+        return SuiKeyPairSECP256K1(bytes(indata[0:33]), bytes(indata[33:]))
 
     def __repr__(self) -> str:
         """To string."""
         return f"PubKey {self._public_key}, PrivKey {self._private_key}"
 
 
+# Keypair class, by signature scheme, for keystring parsing
+_SCHEME_TO_CLS: dict[SignatureScheme, type[KeyPair]] = {
+    SignatureScheme.ED25519: SuiKeyPairED25519,
+    SignatureScheme.SECP256K1: SuiKeyPairSECP256K1,
+}
+
+
 # Utility functions
 def _valid_mnemonic(mnemonics: Union[str, list[str]] = "") -> str:
     """_valid_mnemonic Validate, or create, mnemonic word string.
@@ -295,11 +352,11 @@ def _generate_secp256k1(
     prv_key = bip32_ctx.PrivateKey().Raw().ToBytes()
     # Instantiate secp256k1 library keypair
     # 1. Private, or signer, key
-    secp_priv = secp256k1.PrivateKey(prv_key, raw=True)
+    secp_priv = Secp256k1PrivateKey(prv_key)
     # 2. Public, or verifier, key
-    secp_pub = secp_priv.pubkey.serialize(compressed=True)
+    secp_pub = secp_priv.public_key.format(compressed=True)
     _valid_pubkey("ValidateAndGetSecp256k1Key", secp_pub)
-    return mnemonic_phrase, SuiKeyPairSECP256K1(secp_pub, secp_priv.private_key)
+    return mnemonic_phrase, SuiKeyPairSECP256K1._from_signer(secp_priv)  # pylint: disable=protected-access
 
 
 def _generate_ed25519(mnemonics: Union[str, list[str]] = "", derv_path: str = None) -> tuple[str, SuiKeyPairED25519]:
@@ -321,7 +378,7 @@ def _generate_ed25519(mnemonics: Union[str, list[str]] = "", derv_path: str = No
     prv_key = bip32_ctx.PrivateKey().Raw().ToBytes()
     # Instantiate ed25519 library keypair
     # Private, or signer, key
-    ed_priv = SigningKey(base64.b64encode(prv_key), encoder=Base64Encoder)
+    ed_priv = SigningKey(prv_key)
     ed_enc_prv = ed_priv.encode()
     # Public, or verifier, key
     ed_pub = ed_priv.verify_key
@@ -330,6 +387,43 @@ def _generate_ed25519(mnemonics: Union[str, list[str]] = "", derv_path: str = No
     return mnemonic_phrase, SuiKeyPairED25519(ed_enc_pub, ed_enc_prv)
 
 
+# Keypair generator, by signature scheme, for mnemonic derivation
+_SCHEME_TO_GENERATOR = {
+    SignatureScheme.ED25519: _generate_ed25519,
+    SignatureScheme.SECP256K1: _generate_secp256k1,
+}
+
+
+def _seeded_ed25519(seed: bytes) -> SuiKeyPairED25519:
+    """_seeded_ed25519 Create ed25519 keypair from a random seed.
+
+    :param seed: ed25519 private key seed
+    :type seed: bytes
+    :return: keypair for seed
+    :rtype: SuiKeyPairED25519
+    """
+    signer = SigningKey(seed)
+    return SuiKeyPairED25519(bytes(signer.verify_key), bytes(signer))
+
+
+def _seeded_secp256k1(seed: bytes) -> SuiKeyPairSECP256K1:
+    """_seeded_secp256k1 Create secp256k1 keypair from a random seed.
+
+    :param seed: secp256k1 private key secret
+    :type seed: bytes
+    :return: keypair for seed
+    :rtype: SuiKeyPairSECP256K1
+    """
+    return SuiKeyPairSECP256K1._from_signer(Secp256k1PrivateKey(seed))  # pylint: disable=protected-access
+
+
+# Seed length and seeded keypair builder, by signature scheme, for batch generation
+_SCHEME_TO_SEEDED = {
+    SignatureScheme.ED25519: (ED25519_PRIVATEKEY_BYTES_LEN, _seeded_ed25519),
+    SignatureScheme.SECP256K1: (SECP256K1_PRIVATEKEY_BYTES_LEN, _seeded_secp256k1),
+}
+
+
 def keypair_from_keystring(keystring: str) -> KeyPair:
     """keypair_from_keystring Parse keystring to keypair.
 
@@ -343,12 +437,10 @@ def keypair_from_keystring(keystring: str) -> KeyPair:
     if len(keystring) != SUI_KEYPAIR_LEN:
         raise SuiInvalidKeystringLength(len(keystring))
     addy_bytes = base64.b64decode(keystring)
-    match addy_bytes[0]:
-        case SignatureScheme.ED25519:
-            return SuiKeyPairED25519.from_bytes(addy_bytes[1:])
-        case SignatureScheme.SECP256K1:
-            return SuiKeyPairSECP256K1.from_bytes(addy_bytes[1:])
-    raise NotImplementedError
+    keypair_cls = _SCHEME_TO_CLS.get(addy_bytes[0])
+    if keypair_cls is None:
+        raise NotImplementedError
+    return keypair_cls.from_bytes(memoryview(addy_bytes)[1:])
 
 
 def create_new_keypair(
@@ -366,13 +458,32 @@ def create_new_keypair(
     :return: mnemonic words and new keypair
     :rtype: tuple[str, KeyPair]
     """
-    match keytype:
-        case SignatureScheme.ED25519:
-            return _generate_ed25519(mnemonics, derv_path)
-        case SignatureScheme.SECP256K1:
-            return _generate_secp256k1(mnemonics, derv_path)
-        case _:
-            raise NotImplementedError
+    generator = _SCHEME_TO_GENERATOR.get(keytype)
+    if generator is None:
+        raise NotImplementedError
+    return generator(mnemonics, derv_path)
+
+
+def create_new_keypairs(count: int, keytype: SignatureScheme = SignatureScheme.ED25519) -> list[KeyPair]:
+    """create_new_keypairs Generate a batch of new random keypairs.
+
+    Seeds for the whole batch are drawn from a single random buffer. Unlike create_new_keypair,
+    no mnemonics are generated so keypairs are not recoverable from words.
+
+    :param count: number of keypairs to generate
+    :type count: int
+    :param keytype: One of ED25519 or SECP256K1 key type, defaults to SignatureScheme.ED25519
+    :type keytype: SignatureScheme, optional
+    :raises NotImplementedError: If invalid keytype is provided
+    :return: list of new keypairs
+    :rtype: list[KeyPair]
+    """
+    seeded = _SCHEME_TO_SEEDED.get(keytype)
+    if seeded is None:
+        raise NotImplementedError
+    seed_len, builder = seeded
+    seeds = os.urandom(seed_len * count)
+    return [builder(seeds[index : index + seed_len]) for index in range(0, len(seeds), seed_len)]
 
 
 def create_new_address(
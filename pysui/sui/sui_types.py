@@ -18,7 +18,6 @@ import re
 
 # import json
 import base64
-import binascii
 import hashlib
 from typing import Any, Generic, TypeVar, Union, Optional
 from dataclasses import dataclass, field
@@ -397,14 +396,12 @@ class SuiAddress(SuiBaseType):
         return cls.from_bytes(base64.b64decode(keystring))
 
     @classmethod
-    def from_bytes(cls, in_bytes: bytes) -> "SuiAddress":
+    def from_bytes(cls, in_bytes: Union[bytes, memoryview]) -> "SuiAddress":
         """Create address from bytes."""
-        # print(f"In bytes = {in_bytes}")
-        digest = in_bytes[0:33] if in_bytes[0] == 0 else in_bytes[0:34]
-        glg = hashlib.sha3_256()
-        glg.update(digest)
-        hash_bytes = binascii.hexlify(glg.digest())[0:40]
-        return cls(hash_bytes.decode("utf-8"))
+        # Hash a view of the scheme and public key bytes rather than a sliced copy
+        in_view = memoryview(in_bytes)
+        digest = in_view[0:33] if in_view[0] == 0 else in_view[0:34]
+        return cls(hashlib.sha3_256(digest).hexdigest()[0:40])
 
 
 @dataclass
@@ -946,11 +943,11 @@ class EventID(SuiMap):
 def address_from_keystring(indata: str) -> SuiAddress:
     """From a 88 byte keypair string create a SuiAddress."""
     #   Check address is legit keypair
-    from .sui_crypto import keypair_from_keystring
+    from .sui_crypto import keypair_from_keystring, _SCHEME_TAG
 
-    _kp = keypair_from_keystring(indata)
-    #   decode from base64 and generate
-    return SuiAddress.from_bytes(base64.b64decode(indata))
+    kpair = keypair_from_keystring(indata)
+    #   generate from the validated keypair rather than decoding again
+    return SuiAddress.from_bytes(b"".join((_SCHEME_TAG[kpair.scheme], kpair.public_key.key_bytes)))
 
 
 # Transaction Results
@@ -13,6 +13,8 @@
 
 """Synchronous RPC testing."""
 
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 
 from pysui.sui import SuiClient, SuiRpcResult
 from pysui.sui.sui_builders import GetCommittee, GetObject, GetPastObject
@@ -28,6 +30,25 @@ from pysui.sui.sui_types import (
 )
 
 
+def get_objects_concurrently(executor: Executor, client: SuiClient, ident_list: list[ObjectID]) -> list:
+    """get_objects_concurrently Fetch objects with one request per identifier spread over executor.
+
+    :param executor: Executor the requests are submitted to
+    :type executor: Executor
+    :param client: Synchronous http client
+    :type client: SuiClient
+    :param ident_list: Object identifiers to fetch
+    :type ident_list: list[ObjectID]
+    :return: Object data in the same order as ident_list
+    :rtype: list
+    """
+    objects = []
+    for result in executor.map(client.get_object, ident_list):
+        assert result.is_ok()
+        objects.append(result.result_data)
+    return objects
+
+
 def get_gas(client: SuiClient, for_address: SuiAddress = None) -> list[SuiGas]:
     """get_gas Utility func to refresh gas for address.
 
@@ -39,9 +60,8 @@ def get_gas(client: SuiClient, for_address: SuiAddress = None) -> list[SuiGas]:
     result: SuiRpcResult = client.get_address_object_descriptors(SuiGasDescriptor, for_address)
     assert result.is_ok()
     ident_list = [desc.identifier for desc in result.result_data]
-    result: SuiRpcResult = client.get_objects_for(ident_list)
-    assert result.is_ok()
-    return result.result_data
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return get_objects_concurrently(executor, client, ident_list)
 
 
 def get_data(client: SuiClient, for_address: SuiAddress = None) -> list[SuiData]:
@@ -57,9 +77,8 @@ def get_data(client: SuiClient, for_address: SuiAddress = None) -> list[SuiData]
     result: SuiRpcResult = client.get_address_object_descriptors(MoveDataDescriptor, for_address)
     assert result.is_ok()
     ident_list = [desc.identifier for desc in result.result_data]
-    result: SuiRpcResult = client.get_objects_for(ident_list)
-    assert result.is_ok()
-    return result.result_data
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return get_objects_concurrently(executor, client, ident_list)
 
 
 def test_get_gas_activeaddress_pass(sui_client: SuiClient):
@@ -71,8 +90,7 @@ def test_get_gas_activeaddress_pass(sui_client: SuiClient):
     """
     gas_objects = get_gas(sui_client)
     assert len(gas_objects) > 3
-    gas_balances = [gas.balance for gas in gas_objects]
-    total_balance = sum(gas_balances)
+    total_balance = sum(gas.balance for gas in gas_objects)
     assert total_balance > 0
 
 
@@ -87,12 +105,22 @@ def test_get_gas_anyaddress_pass(sui_client: SuiClient):
     active_address = sui_client.config.active_address
     addresses = set(sui_client.config.addresses)
     addresses.remove(active_address.identifier)
-    for anyaddress in addresses:
-        inaddr = SuiAddress.from_hex_string(anyaddress)
-        gas_objects = get_gas(sui_client, inaddr)
-        if gas_objects:
-            gas_balances = [gas.balance for gas in gas_objects]
-            total_balance = sum(gas_balances)
+    get_descriptors = partial(sui_client.get_address_object_descriptors, SuiGasDescriptor)
+    # One pool for the whole fan-out: descriptors for every address, then every gas object
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ident_lists = []
+        for result in executor.map(get_descriptors, [SuiAddress.from_hex_string(addy) for addy in addresses]):
+            assert result.is_ok()
+            ident_lists.append([desc.identifier for desc in result.result_data])
+        gas_objects = get_objects_concurrently(
+            executor, sui_client, [ident for idents in ident_lists for ident in idents]
+        )
+    offset = 0
+    for idents in ident_lists:
+        address_gas = gas_objects[offset : offset + len(idents)]
+        offset += len(idents)
+        if address_gas:
+            total_balance = sum(gas.balance for gas in address_gas)
             assert total_balance > 0
 
 
@@ -134,13 +162,13 @@ def test_get_past_object_pass(sui_client: SuiClient):
     """
     gas_objects = get_gas(sui_client)
     assert gas_objects
-    multi_version = list(filter(lambda x: x.version > 1, gas_objects))
-    assert multi_version
-    builder = GetPastObject(multi_version[0].identifier, multi_version[0].version - 1)
+    multi_version = next((x for x in gas_objects if x.version > 1), None)
+    assert multi_version is not None
+    builder = GetPastObject(multi_version.identifier, multi_version.version - 1)
     gas_object2 = sui_client.execute(builder)
     assert gas_object2
-    assert gas_object2.result_data.version < multi_version[0].version
-    assert gas_object2.result_data.balance > multi_version[0].balance
+    assert gas_object2.result_data.version < multi_version.version
+    assert gas_object2.result_data.balance > multi_version.balance
 
 
 def test_get_past_object_fail(sui_client: SuiClient):
@@ -151,9 +179,9 @@ def test_get_past_object_fail(sui_client: SuiClient):
     """
     gas_objects = get_gas(sui_client)
     assert gas_objects
-    multi_version = list(filter(lambda x: x.version > 1, gas_objects))
-    assert multi_version
-    builder = GetPastObject(multi_version[0].identifier, multi_version[0].version + 1)
+    multi_version = next((x for x in gas_objects if x.version > 1), None)
+    assert multi_version is not None
+    builder = GetPastObject(multi_version.identifier, multi_version.version + 1)
     result = sui_client.execute(builder)
     assert isinstance(result.result_data, ObjectVersionTooHigh)
 
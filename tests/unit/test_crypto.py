@@ -24,9 +24,13 @@ from pysui.sui.sui_crypto import (
     SuiPrivateKeyED25519,
     SuiPublicKeySECP256K1,
     SuiPrivateKeySECP256K1,
+    SuiKeyPairED25519,
+    SuiKeyPairSECP256K1,
     keypair_from_keystring,
     create_new_address,
+    create_new_keypairs,
 )
+from pysui.sui.sui_excepts import SuiInvalidKeyPair
 from pysui.sui.sui_constants import (
     SUI_KEYPAIR_LEN,
     ED25519_PRIVATEKEY_BYTES_LEN,
@@ -40,7 +44,7 @@ TEST_SECP256K1_KEYSTRING = "AQMm9+3O2Yn5KBWbwsRt33Gz6e6ankSeukxDFd9G30qSFQnSiMUH
 TEST_ED25519_ADDRESS = "0x83a299c2d0be351bdec7f509d16d5224075d0ab9"
 TEST_SECP256K1_ADDRESS = "0xf5493a8ef4fbf1cbf0edcfdc37687fd6c2874f6c"
 SIGN_INPUT_DATA = "APfrWX20DMtUWAvHxuv31tqBHogKNKnxuKA1QeB+wXGUx+Rp9/CGD9TzeazNhELCD2Y4o2VW5dL1juwzOUuEiAI9cjQi2P11jfUgBHa+Ah55U457R8w6ydbqSuIixhMm6w=="
-# SECP_SIG = "3ka2oyct+ukiW65kEQBEFiVbhKRRwACxC6wbGBYjOlpltwqP5gdWildwJJoEAd8fwZqf+kufUWRsOkZFHr0LggA="
+SECP_SIG = "3ka2oyct+ukiW65kEQBEFiVbhKRRwACxC6wbGBYjOlpltwqP5gdWildwJJoEAd8fwZqf+kufUWRsOkZFHr0LggA="
 ED25_SIG = "FRS1Amac5cBHHD+HHtHRsmOnc7ytS59pGYiHrWb41XSxRLrtGxX7kvkaSB5IyxzXJNxKzdMMnBS28Jf/Oid1BQ=="
 
 
@@ -103,6 +107,17 @@ def test_new_secp256k1_address_pass() -> None:
     assert suiaddress is not None
 
 
+def test_new_keypairs_pass() -> None:
+    """Test batch keypair generation for both schemes."""
+    for scheme in (SignatureScheme.ED25519, SignatureScheme.SECP256K1):
+        keypairs = create_new_keypairs(4, scheme)
+        assert len(keypairs) == 4
+        assert len({kpair.to_b64() for kpair in keypairs}) == 4
+        for kpair in keypairs:
+            assert kpair.scheme == scheme
+            assert keypair_from_keystring(kpair.to_b64()).to_b64() == kpair.to_b64()
+
+
 def test_secp256k1_address_pass() -> None:
     """Test conversion from keystring to address."""
     suiaddress = address_from_keystring(TEST_SECP256K1_KEYSTRING)
@@ -110,6 +125,44 @@ def test_secp256k1_address_pass() -> None:
     assert TEST_SECP256K1_ADDRESS == str(suiaddress.identifier)
 
 
+def test_keypair_to_b64_pass() -> None:
+    """Test keypair serializes back to its keystring."""
+    assert keypair_from_keystring(TEST_ED25519_KEYSTRING).to_b64() == TEST_ED25519_KEYSTRING
+    assert keypair_from_keystring(TEST_SECP256K1_KEYSTRING).to_b64() == TEST_SECP256K1_KEYSTRING
+
+
+def test_keypair_from_b64_pass() -> None:
+    """Test each keypair class parses its own scheme keystring."""
+    edkp = SuiKeyPairED25519.from_b64(TEST_ED25519_KEYSTRING)
+    assert isinstance(edkp, SuiKeyPairED25519)
+    assert edkp.to_b64() == TEST_ED25519_KEYSTRING
+    secpkp = SuiKeyPairSECP256K1.from_b64(TEST_SECP256K1_KEYSTRING)
+    assert isinstance(secpkp, SuiKeyPairSECP256K1)
+    assert secpkp.to_b64() == TEST_SECP256K1_KEYSTRING
+    assert isinstance(secpkp.public_key.key_bytes, bytes)
+
+
+def test_secp256k1_invalid_key_fail() -> None:
+    """Test invalid secp256k1 key material raises SuiInvalidKeyPair."""
+    # Not a compressed point prefix
+    with pytest.raises(SuiInvalidKeyPair):
+        SuiKeyPairSECP256K1.from_bytes(b"\x05" * 33 + b"\x01" * 32)
+    # Valid prefix but x coordinate is not on the curve
+    with pytest.raises(SuiInvalidKeyPair):
+        SuiKeyPairSECP256K1.from_bytes(b"\x02" + b"\xff" * 32 + b"\x01" * 32)
+    # Zero is not a valid secret
+    with pytest.raises(SuiInvalidKeyPair):
+        SuiPrivateKeySECP256K1(b"\x00" * 32)
+
+
+def test_secp256k1_unique_pass() -> None:
+    """Test generated secp256k1 keypair signs with the key it serializes."""
+    kpair = SuiKeyPairSECP256K1.unique()
+    reloaded = keypair_from_keystring(kpair.to_b64())
+    data = base64.b64decode(SIGN_INPUT_DATA)
+    assert kpair.private_key.sign(data).signature == reloaded.private_key.sign(data).signature
+
+
 def test_edwards_signing() -> None:
     """Test signing."""
     edkp = keypair_from_keystring(TEST_ED25519_KEYSTRING)
@@ -117,11 +170,11 @@ def test_edwards_signing() -> None:
     assert sig.signature == ED25_SIG
 
 
-# def test_secp_signing() -> None:
-#     """Test signing."""
-#     edkp = keypair_from_keystring(TEST_SECP256K1_KEYSTRING)
-#     sig = edkp.private_key.sign(base64.b64decode(SIGN_INPUT_DATA))
-#     assert sig.signature == SECP_SIG
+def test_secp_signing() -> None:
+    """Test signing."""
+    edkp = keypair_from_keystring(TEST_SECP256K1_KEYSTRING)
+    sig = edkp.private_key.sign(base64.b64decode(SIGN_INPUT_DATA))
+    assert sig.signature == SECP_SIG
 
 
 @pytest.mark.xfail(raises=Exception)